@@ -1 +1,2 @@
 from mdb_singleton.singleton import MongoDBSingleton, MongoDBSingletonAsync
+from mdb_singleton.middleware import MongoDBMiddleware, MongoDBMiddlewareASGI
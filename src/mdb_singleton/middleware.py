@@ -0,0 +1,47 @@
+import atexit
+
+from mdb_singleton.singleton import MongoDBSingleton, MongoDBSingletonAsync
+import mdb_singleton.settings as settings
+
+
+# Registered once at import time, so connections are closed exactly once at
+# shutdown no matter how many middleware instances the framework builds.
+atexit.register(MongoDBSingleton.close_all_connections)
+
+if settings.PREALLOCATE_WORKERS:
+    MongoDBSingleton.preallocate(settings.PREALLOCATE_WORKERS)
+
+
+class MongoDBMiddleware:
+    """
+    MongoDBMiddleware provides a MongoDB connection singleton for the current thread,
+    created when the middleware is instantiated and reused across requests.
+
+    Subclasses select their singleton class via the mongodb_singleton class attribute
+    instead of overriding __init__.
+    """
+
+    __slots__ = ("get_response", "mongo_conn")
+
+    mongodb_singleton = MongoDBSingleton
+
+    def __init__(self, get_response=None, mongodb_singleton=None):
+        self.get_response = get_response
+        self.mongo_conn = (mongodb_singleton or type(self).mongodb_singleton)()
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+
+class MongoDBMiddlewareASGI(MongoDBMiddleware):
+    """
+    MongoDBMiddlewareASGI extends MongoDBMiddleware for asynchronous (ASGI) applications,
+    providing a MongoDB connection singleton per event loop.
+    """
+
+    __slots__ = ()
+
+    mongodb_singleton = MongoDBSingletonAsync
+
+    async def __call__(self, request):
+        return await self.get_response(request)
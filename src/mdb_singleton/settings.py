@@ -1 +1,15 @@
-LOGGING_ENABLED = True
\ No newline at end of file
+import os
+
+LOGGING_ENABLED = True
+
+# Sizing for the shared MongoClient connection pool. A single pool sized to the
+# worker count beats per-thread pools for both latency and server load.
+MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+
+# How long server selection may block before an operation fails.
+SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "30000"))
+
+# Expected worker-thread count; when set, the middleware pre-grows the
+# connection registry on import to avoid resizes during warm-up.
+PREALLOCATE_WORKERS = int(os.getenv("MONGO_PREALLOCATE_WORKERS", "0"))
\ No newline at end of file
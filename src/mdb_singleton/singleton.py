@@ -1,19 +1,32 @@
 import os
-from dotenv import load_dotenv
+from contextvars import ContextVar
 import logging
 import threading
 import asyncio
+from weakref import WeakValueDictionary
 from pymongo import errors, MongoClient
 from motor.motor_asyncio import AsyncIOMotorClient
 
 import mdb_singleton.settings as settings
 
-# Load environment variables from .env file
-load_dotenv()
+# Read once at import; callers using a .env file must load it (e.g. with
+# python-dotenv's load_dotenv) before importing this module.
+MONGO_URI = os.getenv("MONGO_URI")
+if not MONGO_URI:
+    raise RuntimeError("The MONGO_URI environment variable is required")
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(levelname)s:     %(message)s")
+logger = logging.getLogger(__name__)
+
+
+# Per-thread storage holding each thread's connection instance. Reading it is a
+# single thread-state lookup, needs no locking, and doubles as the strong
+# reference that keeps the weak registry entry alive.
+_tls = threading.local()
+
+# Per-context cache of the (process id, event loop) key. Child tasks inherit the
+# cached key through copy_context, so they skip the loop lookup entirely.
+_loop_key: ContextVar = ContextVar("mdb_loop_key", default=None)
 
 
 class MongoDBConnection:
@@ -22,127 +35,289 @@ class MongoDBConnection:
     to MongoDB. It supports both synchronous (thread) and asynchronous (asyncio) clients.
     """
 
-    def _initialize_connection(self):
+    __slots__ = ("_client", "key", "__weakref__")
+
+    @property
+    def client(self):
         """
-        Internal method to initialize MongoDB connection based on the specified client type.
+        The MongoDB client for this connection, created lazily on first access.
         """
-        MONGO_URI: str = os.getenv("MONGO_URI")
+        client = self._client
 
-        try:
-            client_class = MongoClient if self.operation == "sync" else AsyncIOMotorClient
-            self.client = client_class(MONGO_URI)
+        if client is None:
+            self._initialize_connection()
+            client = self._client
 
-            if settings.LOGGING_ENABLED:
-                msg = f"MongoDB connection established with key: {self.key} ({self.type})"
-                logging.info(msg=msg)
+        return client
 
-        except errors.ServerSelectionTimeoutError as e:
-            msg = "MongoDB server selection timeout error: %s"
-            logging.error(msg=msg, exc_info=e)
+    def _acquire_client(self):
+        """
+        Return the MongoDB client for this connection; subclasses specialize this
+        through their _client_cls attribute.
+        """
+        raise NotImplementedError
+
+    def _initialize_connection(self):
+        """
+        Internal method to initialize the MongoDB client for this connection.
 
-        except errors.ConnectionFailure as e:
-            msg = "MongoDB connection error: %s"
-            logging.error(msg=msg, exc_info=e)
+        Called lazily from the client property; the check is repeated under the class
+        lock so concurrent first accesses create only one client.
+        """
+        with type(self)._lock:
+            if self._client is not None:
+                return
 
-        except errors.InvalidURI as e:
-            msg = "MongoDB Invalid URI error: %s"
-            logging.error(msg=msg, exc_info=e)
+            try:
+                self._client = self._acquire_client()
 
-        except errors.ConfigurationError as e:
-            msg = "MongoDB configuration error: %s"
-            logging.error(msg=msg, exc_info=e)
+            except (errors.InvalidURI, errors.ConfigurationError) as e:
+                # Client construction is lazy: network errors such as
+                # ServerSelectionTimeoutError only surface on the first operation,
+                # so the only failures possible here are URI/configuration ones.
+                logger.exception("MongoDB connection error (%s): %s", type(e).__name__, e)
+                return
+
+            if settings.LOGGING_ENABLED:
+                logger.info(
+                    "MongoDB connection established with key: %s (%s)",
+                    self.key,
+                    type(self).__name__,
+                )
 
     def _close_connection(self):
         """
         Close the MongoDB connection if it exists.
         """
-        if self.client:
-            self.client.close()
+        if self._client:
+            self._client.close()
+
+            self._client = None
 
             if settings.LOGGING_ENABLED:
-                msg = f"MongoDB connection closed for key: {self.key} ({self.type})"
-                logging.info(msg=msg)
+                logger.info(
+                    "MongoDB connection closed for key: %s (%s)", self.key, type(self).__name__
+                )
 
 
 class MongoDBSingleton(MongoDBConnection):
     """
     MongoDBSingleton class provides a thread-safe singleton pattern for MongoDBConnection.
-    It ensures a single MongoDB connection per thread.
+
+    All threads share a single process-wide MongoClient: the client is thread-safe and
+    maintains its own connection pool, so per-thread clients would only multiply pools,
+    sockets and monitoring threads without any concurrency benefit. Each thread still
+    gets its own lightweight instance (keyed by thread id), but they all serve the same
+    shared client.
     """
 
-    _connections = {}
+    __slots__ = ()
+
+    # Weak registry of live connections: entries disappear automatically when the
+    # owning thread or loop drops its strong reference, so dead threads and
+    # finished loops no longer pin their clients in memory. The strong reference
+    # lives in _tls, tied to the owning thread's lifetime.
+    _connections = WeakValueDictionary()
     _lock = threading.Lock()
+    _shared_client = None
+    _client_lock = threading.Lock()
+    _client_cls = MongoClient
+
+    @classmethod
+    def get_client(cls) -> MongoClient:
+        """
+        Return the process-wide shared MongoClient, creating it on first use.
+        """
+        client = MongoDBSingleton._shared_client
+
+        if client is None:
+            with cls._client_lock:
+                client = MongoDBSingleton._shared_client
+                if client is None:
+                    # connect=False defers the SDAM handshake to the first
+                    # operation instead of paying it here.
+                    client = MongoDBSingleton._client_cls(
+                        MONGO_URI,
+                        maxPoolSize=settings.MAX_POOL_SIZE,
+                        minPoolSize=settings.MIN_POOL_SIZE,
+                        connect=False,
+                        serverSelectionTimeoutMS=settings.SERVER_SELECTION_TIMEOUT_MS,
+                    )
+                    MongoDBSingleton._shared_client = client
+
+                    if settings.LOGGING_ENABLED:
+                        logger.info("MongoDB shared client created")
+
+        return client
+
+    @property
+    def client(self):
+        """
+        The process-wide shared MongoClient. Served directly from get_client rather
+        than cached per instance, so a client closed elsewhere is rebuilt
+        transparently on the next access instead of lingering as a closed client.
+        """
+        return self.get_client()
+
+    def _close_connection(self):
+        """
+        Close the process-wide shared client and reset it, so surviving threads
+        rebuild it lazily on their next access.
+        """
+        with MongoDBSingleton._client_lock:
+            client = MongoDBSingleton._shared_client
+
+            if client is not None:
+                client.close()
+                MongoDBSingleton._shared_client = None
+
+                if settings.LOGGING_ENABLED:
+                    logger.info(
+                        "MongoDB connection closed for key: %s (%s)", self.key, type(self).__name__
+                    )
 
     def __new__(cls, *args, **kwargs):
         """
         Create a new MongoDBConnection instance or return an existing one based on the thread key.
+
+        The fast path reads the thread-local slot directly: each thread only ever sees
+        its own connection, so no key hashing and no locking is needed. On the first
+        call in a thread, the instance is registered in the weak dict (for
+        close_connection / close_all_connections) under the class lock, since
+        WeakValueDictionary's setdefault is a multi-step Python method with no
+        atomicity guarantee of its own. The instance is published fully formed, but
+        its MongoDB client is only created lazily on first access to the client
+        property.
         """
-        key = str(id(threading.current_thread()))
+        # Instances retired via close_connection / close_all_connections have
+        # their key cleared; reject them so a fresh instance is re-registered.
+        instance = getattr(_tls, "connection", None)
+        if instance is not None and instance.key is not None:
+            return instance
+
+        key = threading.get_ident()
+
+        instance = object.__new__(cls)
 
-        if key not in cls._connections:
-            with cls._lock:
-                cls._connections[key] = MongoDBConnection().__new__(cls)
+        instance.key = key
+        instance._client = None
 
-                cls._connections[key].key = key
-                cls._connections[key].type = "thread"
-                cls._connections[key].operation = "sync"
+        with cls._lock:
+            instance = cls._connections.setdefault(key, instance)
 
-                cls._connections[key]._initialize_connection()
+        # The thread-local strong reference keeps the weak registry entry alive
+        # for exactly as long as the owning thread.
+        _tls.connection = instance
 
-        return cls._connections[key]
+        return instance
+
+    @classmethod
+    def preallocate(cls, n_workers: int):
+        """
+        Pre-grow the connection registry for the expected number of worker threads,
+        so the hash table does not resize while the first workers register.
+
+        Placeholder entries are inserted and then deleted one by one: deletion keeps
+        the grown table, whereas clearing would release it.
+        """
+        placeholders = [object.__new__(MongoDBConnection) for _ in range(n_workers)]
+
+        with cls._lock:
+            for i, placeholder in enumerate(placeholders):
+                cls._connections[("preallocate", i)] = placeholder
+
+            for i in range(n_workers):
+                del cls._connections[("preallocate", i)]
 
     @classmethod
     def close_all_connections(cls):
         """
         Close all MongoDB connections created by the singleton pattern.
         """
-        keys = list(cls._connections.keys())
+        with cls._lock:
+            while cls._connections:
+                _, instance = cls._connections.popitem()
+                instance._close_connection()
 
-        for key in keys:
-            cls._connections[key]._close_connection()
-            cls._connections.pop(key)
+                # Mark the instance as retired so thread-local fast paths
+                # reject it instead of serving an unregistered connection.
+                instance.key = None
 
     @classmethod
-    def close_connection(cls, key: str):
+    def close_connection(cls, key: int | tuple[int, int]):
         """
-        Close the MongoDB connection associated with the given key.
+        Close the MongoDB connection associated with the given key: a thread id for
+        sync connections, a (process id, event loop id) tuple for async ones.
         """
-        keys = list(cls._connections.keys())
+        instance = cls._connections.pop(key, None)
+
+        if instance is not None:
+            instance._close_connection()
 
-        if key in keys:
-            cls._connections[key]._close_connection()
-            cls._connections.pop(key)
+            # Mark the instance as retired so thread-local fast paths
+            # reject it instead of serving an unregistered connection.
+            instance.key = None
 
 
 class MongoDBSingletonAsync(MongoDBSingleton):
     """
     MongoDBSingletonAsync extends MongoDBSingleton for asynchronous (asyncio) use.
-    It ensures a single MongoDB connection per asyncio task.
+
+    It ensures a single MongoDB connection per event loop rather than per task: Motor
+    clients are safe to share across tasks on the same loop, and a per-task client would
+    build a fresh connection pool for every request handler task. The key includes the
+    process id so a forked worker never reuses a client whose sockets belong to the
+    parent process.
     """
 
+    __slots__ = ()
+
+    _client_cls = AsyncIOMotorClient
+
+    # Restore the per-instance client behavior from MongoDBConnection: async
+    # clients are per event loop, not the process-wide shared client.
+    client = MongoDBConnection.client
+    _close_connection = MongoDBConnection._close_connection
+
+    def _acquire_client(self):
+        return type(self)._client_cls(
+            MONGO_URI,
+            maxPoolSize=settings.MAX_POOL_SIZE,
+            minPoolSize=settings.MIN_POOL_SIZE,
+            serverSelectionTimeoutMS=settings.SERVER_SELECTION_TIMEOUT_MS,
+        )
+
     def __new__(cls, *args, **kwargs):
         """
-        Create a new MongoDBConnection instance or return an existing one based on the task key.
+        Create a new MongoDBConnection instance or return an existing one based on the
+        (process id, event loop) key.
+
+        Uses the same registration as MongoDBSingleton: an unlocked fast path, with
+        first-time registration done under the class lock. The Motor client is created
+        lazily on first access to the client property.
         """
-        key = None
-        type = ""
+        key = _loop_key.get()
+        if key is None or key[0] != os.getpid():
+            try:
+                key = (os.getpid(), id(asyncio.get_running_loop()))
+                _loop_key.set(key)
+            except RuntimeError:
+                key = (os.getpid(), threading.get_ident())
 
-        if asyncio.get_event_loop().is_running():
-            key = str(id(asyncio.current_task()))
-            type = "task"
+        instance = cls._connections.get(key)
+        if instance is not None:
+            return instance
 
-        if key is None:
-            key = str(id(threading.current_thread()))
-            type = "thread"
+        instance = object.__new__(cls)
 
-        if key not in cls._connections:
-            with cls._lock:
-                cls._connections[key] = MongoDBConnection().__new__(cls)
+        instance.key = key
+        instance._client = None
 
-                cls._connections[key].key = key
-                cls._connections[key].type = type
-                cls._connections[key].operation = "async"
+        with cls._lock:
+            instance = cls._connections.setdefault(key, instance)
 
-                cls._connections[key]._initialize_connection()
+        # The strong reference lives on the loop's thread, so the registry entry
+        # survives as long as the thread running the loop.
+        _tls.connection_async = instance
 
-        return cls._connections[key]
+        return instance
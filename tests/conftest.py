@@ -0,0 +1,5 @@
+import os
+
+# The package validates MONGO_URI at import time; default it here so the suite
+# runs on a clean checkout. No server is contacted: clients are created lazily.
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
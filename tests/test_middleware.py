@@ -0,0 +1,51 @@
+import unittest
+
+from mdb_singleton.middleware import MongoDBMiddleware
+import mdb_singleton.singleton as singleton
+from mdb_singleton.singleton import MongoDBSingleton
+import mdb_singleton.settings as MDBS
+
+MDBS.LOGGING_ENABLED = False
+
+
+class TestMongoDBMiddleware(unittest.TestCase):
+
+    def tearDown(self):
+        """
+        Close connections of MongoDBSingleton.
+        """
+        for connection in MongoDBSingleton._connections.values():
+            if connection._client:
+                connection._client.close()
+
+        MongoDBSingleton._connections.clear()
+
+        if MongoDBSingleton._shared_client:
+            MongoDBSingleton._shared_client.close()
+            MongoDBSingleton._shared_client = None
+
+        # Drop this thread's cached connection so the next test starts clean.
+        if hasattr(singleton._tls, "connection"):
+            del singleton._tls.connection
+
+    def test_provides_connection(self):
+        """
+        The middleware should hold a MongoDBSingleton connection for the current thread.
+        """
+
+        middleware = MongoDBMiddleware(get_response=lambda request: request)
+
+        msg = "The middleware connection must belong to the MongoDBSingleton class."
+        self.assertIsInstance(middleware.mongo_conn, MongoDBSingleton, msg)
+
+    def test_call_passes_through(self):
+        """
+        Calling the middleware should return the response from get_response unchanged.
+        """
+
+        response = object()
+
+        middleware = MongoDBMiddleware(get_response=lambda request: response)
+
+        msg = "The middleware must return the response from get_response."
+        self.assertIs(middleware(None), response, msg)
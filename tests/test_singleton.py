@@ -1,6 +1,8 @@
+import threading
 import unittest
 from concurrent.futures import ThreadPoolExecutor, wait
 
+import mdb_singleton.singleton as singleton
 from mdb_singleton.singleton import MongoDBSingleton
 import mdb_singleton.settings as MDBS
 
@@ -14,10 +16,18 @@ class TestMongoDBSingleton(unittest.TestCase):
         Close connections of MongoDBSingleton.
         """
         for connection in MongoDBSingleton._connections.values():
-            if connection.client:
-                connection.client.close()
+            if connection._client:
+                connection._client.close()
 
-        MongoDBSingleton._connections = {}
+        MongoDBSingleton._connections.clear()
+
+        if MongoDBSingleton._shared_client:
+            MongoDBSingleton._shared_client.close()
+            MongoDBSingleton._shared_client = None
+
+        # Drop this thread's cached connection so the next test starts clean.
+        if hasattr(singleton._tls, "connection"):
+            del singleton._tls.connection
 
     def test_create_connection(self):
         """
@@ -80,10 +90,19 @@ class TestMongoDBSingleton(unittest.TestCase):
 
         executor = ThreadPoolExecutor(max_workers=threads)
 
+        # Instance creation is cheap (the client is lazy), so a barrier is used to
+        # ensure every worker thread participates instead of one thread draining
+        # the queue.
+        barrier = threading.Barrier(threads)
+
+        def create_connection():
+            barrier.wait()
+            return MongoDBSingleton()
+
         futures = []
 
         for o in range(operations):
-            future = executor.submit(MongoDBSingleton)
+            future = executor.submit(create_connection)
             operations_count += 1
             futures.append(future)
 
@@ -94,9 +113,68 @@ class TestMongoDBSingleton(unittest.TestCase):
         msg = f"The number of connections ({len(connections)}) must be equal to the number of threads ({threads})"
         self.assertEqual(len(connections), threads, msg)
 
+        clients = {id(connection.client) for connection in connections.values()}
+
+        msg = "All threads must share the same MongoClient instance."
+        self.assertEqual(len(clients), 1, msg)
+
         msg = f"The total number of operations ({operations_count}) must match the expected operations ({operations})"
         self.assertEqual(operations_count, operations, msg)
 
+    def test_recreate_after_close_connection(self):
+        """
+        Creating a connection again after closing it should register a fresh instance,
+        so close_all_connections keeps tracking every live connection.
+        """
+
+        connection = MongoDBSingleton()
+        MongoDBSingleton.close_connection(key=connection.key)
+
+        recreated = MongoDBSingleton()
+
+        msg = "A fresh instance must be created after the previous one was closed."
+        self.assertIsNot(recreated, connection, msg)
+
+        msg = "The recreated instance must be stored in the MongoDBSingleton class."
+        self.assertIn(recreated.key, list(MongoDBSingleton._connections.keys()), msg)
+
+    def test_close_connection_rebuilds_shared_client(self):
+        """
+        Closing one thread's connection must not leave other threads holding a
+        permanently closed client; the shared client is rebuilt on next access.
+        """
+
+        connection = MongoDBSingleton()
+        client_before = connection.client
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        other = executor.submit(MongoDBSingleton).result()
+
+        MongoDBSingleton.close_connection(key=other.key)
+
+        client_after = connection.client
+
+        msg = "The shared client must be rebuilt after being closed."
+        self.assertIsNot(client_after, client_before, msg)
+
+    def test_preallocate(self):
+        """
+        Preallocating the registry should leave it empty and not disturb connections
+        created afterwards.
+        """
+
+        MongoDBSingleton.preallocate(n_workers=16)
+
+        connections: dict = MongoDBSingleton._connections
+
+        msg = f"The number of connections ({len(connections)}) must be equal to 0 after preallocation."
+        self.assertEqual(len(connections), 0, msg)
+
+        connection = MongoDBSingleton()
+
+        msg = "The connection instance must be stored in the MongoDBSingleton class."
+        self.assertIn(connection.key, list(connections.keys()), msg)
+
     def test_close_all_connections(self):
         """
         The close_all_connections method of MongoDBSingleton to ensure that all connections are properly closed.
@@ -107,10 +185,16 @@ class TestMongoDBSingleton(unittest.TestCase):
 
         executor = ThreadPoolExecutor(max_workers=threads)
 
+        barrier = threading.Barrier(threads)
+
+        def create_connection():
+            barrier.wait()
+            return MongoDBSingleton()
+
         futures = []
 
         for o in range(operations):
-            future = executor.submit(MongoDBSingleton)
+            future = executor.submit(create_connection)
             futures.append(future)
 
         wait(futures)
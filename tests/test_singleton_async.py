@@ -14,10 +14,14 @@ class TestMongoDBSingletonAsync(unittest.IsolatedAsyncioTestCase):
         Close connections and clean storage of MongoDBSingleton instances.
         """
         for connection in MongoDBSingleton._connections.values():
-            if connection.client:
-                connection.client.close()
+            if connection._client:
+                connection._client.close()
 
-        MongoDBSingleton._connections = {}
+        MongoDBSingleton._connections.clear()
+
+        if MongoDBSingleton._shared_client:
+            MongoDBSingleton._shared_client.close()
+            MongoDBSingleton._shared_client = None
 
     async def create_connection(self):
         connection = MongoDBSingletonAsync()
@@ -80,10 +84,10 @@ class TestMongoDBSingletonAsync(unittest.IsolatedAsyncioTestCase):
         msg = f"The number of connections ({len(connections_after)}) must be equal to 0."
         self.assertEqual(len(connections_after), 0, msg)
 
-    async def test_connection_per_tasks(self):
+    async def test_connection_per_event_loop(self):
         """
-        Each task should create a connection instance, and the total number of instances
-        should match the number of tasks.
+        Tasks running on the same event loop should share a single connection instance,
+        regardless of how many tasks are created.
         """
         operations = 9
         operations_count = 0
@@ -93,12 +97,17 @@ class TestMongoDBSingletonAsync(unittest.IsolatedAsyncioTestCase):
             operations_count += 1
             tasks.append(self.create_connection())
 
-        await asyncio.gather(*tasks)
+        result = await asyncio.gather(*tasks)
 
         connections: dict = MongoDBSingleton._connections
 
-        msg = f"The number of connections ({len(connections)}) must be equal to the number of tasks ({len(tasks)})"
-        self.assertEqual(len(connections), len(tasks), msg)
+        msg = f"The number of connections ({len(connections)}) must be equal to 1."
+        self.assertEqual(len(connections), 1, msg)
+
+        clients = {id(connection.client) for connection in result}
+
+        msg = "All tasks on the same event loop must share the same client instance."
+        self.assertEqual(len(clients), 1, msg)
 
         msg = f"The total number of operations ({operations_count}) must match the expected operations ({operations})"
         self.assertEqual(operations_count, operations, msg)
@@ -116,8 +125,8 @@ class TestMongoDBSingletonAsync(unittest.IsolatedAsyncioTestCase):
 
         connections_before: dict = MongoDBSingleton._connections
 
-        msg = f"The number of connections ({len(connections_before)}) must be equal to the number of tasks ({len(tasks)})"
-        self.assertEqual(len(connections_before), len(tasks), msg)
+        msg = f"The number of connections ({len(connections_before)}) must be equal to 1."
+        self.assertEqual(len(connections_before), 1, msg)
 
         MongoDBSingleton.close_all_connections()
 